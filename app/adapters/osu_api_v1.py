@@ -1,10 +1,10 @@
 import logging
 import random
 from datetime import datetime
-from typing import Any
 
 import httpx
 from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 from app import settings
 from app.common_models import GameMode
@@ -57,6 +57,9 @@ class Beatmap(BaseModel):
     audio_unavailable: int
 
 
+BEATMAP_LIST_ADAPTER = TypeAdapter(list[Beatmap])
+
+
 async def fetch_one_beatmap(
     *,
     beatmap_id: int | None = None,
@@ -64,7 +67,7 @@ async def fetch_one_beatmap(
 ) -> Beatmap | None:
     assert [beatmap_id, beatmap_md5].count(None) == 1
 
-    osu_api_response_data: list[dict[str, Any]] | None = None
+    response: httpx.Response | None = None
     try:
         osu_api_v1_key = random.choice(settings.OSU_API_V1_API_KEYS_POOL)
         response = await osu_api_v1_http_client.get(
@@ -87,17 +90,16 @@ async def fetch_one_beatmap(
         if response.status_code == 403:
             raise ValueError("osu api is down") from None
         response.raise_for_status()
-        osu_api_response_data = response.json()
-        if osu_api_response_data == []:
+        beatmaps = BEATMAP_LIST_ADAPTER.validate_json(response.content)
+        if not beatmaps:
             return None
-        assert osu_api_response_data is not None
-        return Beatmap(**osu_api_response_data[0])
+        return beatmaps[0]
     except Exception:
         logging.exception(
             "Failed to fetch beatmap from osu! API v1",
             extra={
                 "beatmap_id": beatmap_id,
-                "osu_api_response_data": osu_api_response_data,
+                "osu_api_response_data": response.text if response else None,
             },
         )
         raise
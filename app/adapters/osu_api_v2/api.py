@@ -1,5 +1,7 @@
+import asyncio
 import logging
-from typing import Any
+from collections.abc import AsyncGenerator
+from collections.abc import Iterable
 
 import httpx
 
@@ -17,10 +19,50 @@ from app.adapters.osu_api_v2.models import SortBy
 from app.common_models import GameMode
 
 OSU_API_V2_TOKEN_ENDPOINT = "https://osu.ppy.sh/oauth/token"
+OSU_API_V2_BASE_URL = "https://osu.ppy.sh/api/v2/"
+
+# Absolute urls for our hot endpoints; httpx must merge relative urls
+# with the client's base_url on each request, which costs more than
+# parsing an absolute url outright
+BEATMAPS_URL = f"{OSU_API_V2_BASE_URL}beatmaps/"
+BEATMAPSETS_URL = f"{OSU_API_V2_BASE_URL}beatmapsets/"
+BEATMAPSETS_SEARCH_URL = f"{OSU_API_V2_BASE_URL}beatmapsets/search"
+
+# The osu! API returns a fixed number of beatmapsets per search page
+SEARCH_PAGE_SIZE = 50
+MAX_CONCURRENT_SEARCH_REQUESTS = 10
+
+# Search params for each (mode, category) pair, built up-front
+# so the enums aren't re-stringified on every search request
+_SEARCH_MODE_CATEGORY_PARAMS: dict[
+    tuple[GameMode | None, Category | None],
+    httpx.QueryParams,
+] = {
+    (mode, category): httpx.QueryParams(
+        {
+            "m": str(mode.value) if mode is not None else "",
+            "s": str(category.value) if category is not None else "",
+            "played": "",
+        },
+    )
+    for mode in [None, *GameMode]
+    for category in [None, *Category]
+}
+
+# The last ratelimit budget reported by the osu! API, used
+# to limit how many requests we'll make to it concurrently
+_ratelimit_remaining: int | None = None
+
+
+async def _track_ratelimit_remaining(response: httpx.Response) -> None:
+    global _ratelimit_remaining
+    ratelimit_remaining = response.headers.get("X-Ratelimit-Remaining")
+    if ratelimit_remaining is not None:
+        _ratelimit_remaining = int(ratelimit_remaining)
 
 
 osu_api_v2_http_client = httpx.AsyncClient(
-    base_url="https://osu.ppy.sh/api/v2/",
+    base_url=OSU_API_V2_BASE_URL,
     auth=oauth.AsyncOAuth(
         client_credential_sets=[
             oauth.OAuthClientCredentials(
@@ -31,46 +73,103 @@ osu_api_v2_http_client = httpx.AsyncClient(
         token_endpoint=OSU_API_V2_TOKEN_ENDPOINT,
     ),
     timeout=httpx.Timeout(15),
+    event_hooks={"response": [_track_ratelimit_remaining]},
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+        retries=1,
+    ),
 )
 
 
+class OsuApiResponseError(Exception):
+    """The osu! API responded with an unexpected (non-2xx) status code."""
+
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+        super().__init__(f"osu! API responded with status code {status_code}")
+
+
+class OsuApiRateLimitedError(OsuApiResponseError):
+    """The osu! API has ratelimited us; try again after `retry_after` seconds."""
+
+    def __init__(self, retry_after: int | None) -> None:
+        self.retry_after = retry_after
+        super().__init__(429)
+
+
+def _check_response_status(response: httpx.Response) -> None:
+    if response.is_success:
+        return
+
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After")
+        raise OsuApiRateLimitedError(
+            retry_after=(
+                int(retry_after) if retry_after and retry_after.isdigit() else None
+            ),
+        )
+
+    raise OsuApiResponseError(response.status_code)
+
+
 async def get_beatmap(beatmap_id: int) -> BeatmapExtended | None:
-    osu_api_response_data: dict[str, Any] | None = None
+    response: httpx.Response | None = None
     try:
-        response = await osu_api_v2_http_client.get(f"beatmaps/{beatmap_id}")
+        response = await osu_api_v2_http_client.get(f"{BEATMAPS_URL}{beatmap_id}")
         if response.status_code in (404, 451):
             return None
-        response.raise_for_status()
-        osu_api_response_data = response.json()
-        assert osu_api_response_data is not None
-        return BeatmapExtended(**osu_api_response_data)
+        _check_response_status(response)
+        return BeatmapExtended.model_validate_json(response.content)
+    except OsuApiResponseError as exc:
+        logging.warning(
+            "Failed to fetch beatmap from osu! API v2",
+            extra={
+                "beatmap_id": beatmap_id,
+                "status_code": exc.status_code,
+            },
+        )
+        raise
     except Exception:
         logging.exception(
             "Failed to fetch beatmap from osu! API v2",
             extra={
                 "beatmap_id": beatmap_id,
-                "osu_api_response_data": osu_api_response_data,
+                "osu_api_response_data": response.text if response else None,
             },
         )
         raise
 
 
 async def get_beatmapset(beatmapset_id: int) -> BeatmapsetExtended | None:
-    osu_api_response_data: dict[str, Any] | None = None
+    response: httpx.Response | None = None
     try:
-        response = await osu_api_v2_http_client.get(f"beatmapsets/{beatmapset_id}")
+        response = await osu_api_v2_http_client.get(
+            f"{BEATMAPSETS_URL}{beatmapset_id}",
+        )
         if response.status_code in (404, 451):
             return None
-        response.raise_for_status()
-        osu_api_response_data = response.json()
-        assert osu_api_response_data is not None
-        return BeatmapsetExtended(**osu_api_response_data)
+        _check_response_status(response)
+        return BeatmapsetExtended.model_validate_json(response.content)
+    except OsuApiResponseError as exc:
+        logging.warning(
+            "Failed to fetch beatmapset from osu! API v2",
+            extra={
+                "beatmapset_id": beatmapset_id,
+                "status_code": exc.status_code,
+            },
+        )
+        raise
     except Exception:
         logging.exception(
             "Failed to fetch beatmapset from osu! API v2",
             extra={
                 "beatmapset_id": beatmapset_id,
-                "osu_api_response_data": osu_api_response_data,
+                "osu_api_response_data": response.text if response else None,
             },
         )
         raise
@@ -93,29 +192,39 @@ async def search_beatmapsets(
     if [page, cursor_string].count(None) != 1:
         raise ValueError("Exactly one of page or cursor_string must be provided")
 
-    osu_api_response_data: dict[str, Any] | None = None
+    search_params: dict[str, str | int] = {
+        "e": ".".join(extras) if extras else "",
+        "c": ".".join(general_settings) if general_settings else "",
+        "g": genre_id.value if genre_id else "",
+        "l": language_id.value if language_id else "",
+        "nsfw": "" if filter_nsfw else "false",
+        "q": query,
+        "sort": sort_by.value if sort_by else "",
+    }
+    if page:
+        search_params["page"] = page
+    if cursor_string:
+        search_params["cursor_string"] = cursor_string
+
+    response: httpx.Response | None = None
     try:
         response = await osu_api_v2_http_client.get(
-            "beatmapsets/search",
-            params={
-                "e": ".".join(extras) if extras else "",
-                "c": ".".join(general_settings) if general_settings else "",
-                "g": genre_id.value if genre_id else "",
-                "l": language_id.value if language_id else "",
-                "m": mode,
-                "nsfw": "" if filter_nsfw else "false",
-                "played": "",
-                "q": query,
-                "sort": sort_by.value if sort_by else "",
-                "s": category,
-                **({"page": page} if page else {}),
-                **({"cursor_string": cursor_string} if cursor_string else {}),
+            BEATMAPSETS_SEARCH_URL,
+            params=_SEARCH_MODE_CATEGORY_PARAMS[(mode, category)].merge(search_params),
+        )
+        _check_response_status(response)
+        return BeatmapsetSearchResponse.model_validate_json(response.content)
+    except OsuApiResponseError as exc:
+        logging.warning(
+            "Failed to fetch beatmapsets from osu! API v2",
+            extra={
+                "query": query,
+                "page": page,
+                "cursor_string": cursor_string,
+                "status_code": exc.status_code,
             },
         )
-        response.raise_for_status()
-        osu_api_response_data = response.json()
-        assert osu_api_response_data is not None
-        return BeatmapsetSearchResponse(**osu_api_response_data)
+        raise
     except Exception:
         logging.exception(
             "Failed to fetch beatmapsets from osu! API v2",
@@ -135,7 +244,62 @@ async def search_beatmapsets(
                 "sort_by": sort_by.name if sort_by else None,
                 "page": page,
                 "cursor_string": cursor_string,
-                "osu_api_response_data": osu_api_response_data,
+                "osu_api_response_data": response.text if response else None,
             },
         )
         raise
+
+
+async def iter_search_beatmapsets_pages(
+    query: str,
+    *,
+    pages: Iterable[int],
+    general_settings: set[GeneralSetting] | None = None,
+    extras: set[Extra] | None = None,
+    mode: GameMode | None = None,
+    category: Category | None = None,
+    filter_nsfw: bool = True,
+    language_id: LanguageId | None = None,
+    genre_id: GenreId | None = None,
+    sort_by: SortBy | None = None,
+) -> AsyncGenerator[BeatmapsetSearchResponse, None]:
+    """\
+    Iterate over multiple pages of beatmapset search results.
+
+    Pages are fetched concurrently, but yielded in order as soon as each has
+    arrived, so callers can process results while later pages are in flight.
+
+    The number of in-flight requests is bounded by the osu! API's last
+    reported ratelimit budget, up to `MAX_CONCURRENT_SEARCH_REQUESTS`.
+    """
+    max_concurrency = MAX_CONCURRENT_SEARCH_REQUESTS
+    if _ratelimit_remaining is not None:
+        max_concurrency = max(1, min(max_concurrency, _ratelimit_remaining))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_page(page: int) -> BeatmapsetSearchResponse:
+        async with semaphore:
+            return await search_beatmapsets(
+                query,
+                general_settings=general_settings,
+                extras=extras,
+                mode=mode,
+                category=category,
+                filter_nsfw=filter_nsfw,
+                language_id=language_id,
+                genre_id=genre_id,
+                sort_by=sort_by,
+                page=page,
+            )
+
+    tasks = [asyncio.create_task(fetch_page(page)) for page in pages]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        # cancel any pages we no longer need, and retrieve all the tasks'
+        # results so that failed pages aren't reported as never retrieved
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,10 +1,17 @@
 from datetime import datetime
 from enum import IntEnum
 from enum import StrEnum
+from typing import Annotated
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import Strict
+from pydantic import with_config
+
+# NOTE: pydantic requires typing_extensions' TypedDict on python < 3.12
+from typing_extensions import TypedDict
 
 from app.common_models import RankedStatus
 
@@ -16,12 +23,22 @@ class Ruleset(StrEnum):
     MANIA = "mania"
 
 
-class Failtimes(BaseModel):
+# NOTE: the leaf structures below are validated strictly, as the osu! API
+#       returns correctly typed json. Enum-typed fields opt back out with
+#       `Strict(False)`, as strict python-mode validation would otherwise
+#       reject plain values (e.g. from `model_dump()` or a test fixture).
+@with_config(ConfigDict(strict=True))
+class Failtimes(TypedDict):
     exit: list[int]  # TODO: nullable? osu api says yes
     fail: list[int]  # TODO: nullable? osu api says yes
 
 
 class Beatmap(BaseModel):
+    # NOTE: `frozen` only prevents reassigning fields; the TypedDict leaves
+    #       are still plain (mutable) dicts, which the usecase cache shares
+    #       across requests. Callers must treat them as read-only.
+    model_config = ConfigDict(frozen=True)
+
     beatmapset_id: int
     difficulty_rating: float
     id: int
@@ -46,7 +63,6 @@ class Beatmap(BaseModel):
 class BeatmapExtended(Beatmap):
     accuracy: float
     ar: float
-    beatmapset_id: int
     convert: bool
     count_circles: int
     count_sliders: int
@@ -64,29 +80,36 @@ class BeatmapExtended(Beatmap):
     url: str
 
 
-class Covers(BaseModel):
+@with_config(ConfigDict(strict=True))
+class Covers(TypedDict):
     cover: str
-    cover2x: str = Field(alias="cover@2x")
+    cover2x: Annotated[str, Field(alias="cover@2x")]
     card: str
-    card2x: str = Field(alias="card@2x")
+    card2x: Annotated[str, Field(alias="card@2x")]
     list: str
-    list2x: str = Field(alias="list@2x")
+    list2x: Annotated[str, Field(alias="list@2x")]
     slimcover: str
-    slimcover2x: str = Field(alias="slimcover@2x")
+    slimcover2x: Annotated[str, Field(alias="slimcover@2x")]
 
 
-class RequiredMeta(BaseModel):
+@with_config(ConfigDict(strict=True))
+class RequiredMeta(TypedDict):
     main_ruleset: int
     non_main_ruleset: int
 
 
-class NominationsSummary(BaseModel):
+@with_config(ConfigDict(strict=True))
+class NominationsSummary(TypedDict):
     current: int
-    eligible_main_rulesets: list[Ruleset] | None = None
+    eligible_main_rulesets: Annotated[
+        list[Annotated[Ruleset, Strict(False)]] | None,
+        Field(default=None),
+    ]
     required_meta: RequiredMeta
 
 
-class Availability(BaseModel):
+@with_config(ConfigDict(strict=True))
+class Availability(TypedDict):
     download_disabled: bool
     more_information: str | None
 
@@ -107,12 +130,14 @@ class GenreId(IntEnum):
     JAZZ = 14
 
 
-class Genre(BaseModel):
-    id: GenreId | None
+@with_config(ConfigDict(strict=True))
+class Genre(TypedDict):
+    id: Annotated[GenreId | None, Strict(False)]
     name: str
 
 
-class Description(BaseModel):
+@with_config(ConfigDict(strict=True))
+class Description(TypedDict):
     description: str | None  # (html string)
 
 
@@ -133,12 +158,15 @@ class LanguageId(IntEnum):
     OTHER = 14
 
 
-class Language(BaseModel):
-    id: LanguageId
+@with_config(ConfigDict(strict=True))
+class Language(TypedDict):
+    id: Annotated[LanguageId, Strict(False)]
     name: str
 
 
 class Beatmapset(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     artist: str
     artist_unicode: str | None
     covers: Covers
@@ -195,13 +223,15 @@ class BeatmapsetExtended(Beatmapset):
     track_id: int | None
 
 
-class Cursor(BaseModel):
-    approved_date: int | None = None
-    score: float | None = Field(None, alias="_score")
+@with_config(ConfigDict(strict=True))
+class Cursor(TypedDict):
+    approved_date: Annotated[int | None, Field(default=None)]
+    score: Annotated[float | None, Field(default=None, alias="_score")]
     id: int
 
 
-class Search(BaseModel):
+@with_config(ConfigDict(strict=True))
+class Search(TypedDict):
     sort: str  # TODO: enum
 
 
@@ -238,15 +268,18 @@ class Category(IntEnum):
         cls,
         osu_api_status: RankedStatus,
     ) -> "Category | None":
-        return {
-            RankedStatus.NOT_SUBMITTED: None,
-            RankedStatus.PENDING: Category.PENDING,
-            RankedStatus.UPDATE_AVAILABLE: None,
-            RankedStatus.RANKED: Category.RANKED,
-            RankedStatus.APPROVED: Category.RANKED,
-            RankedStatus.QUALIFIED: Category.QUALIFIED,
-            RankedStatus.LOVED: Category.LOVED,
-        }.get(osu_api_status)
+        return _RANKED_STATUS_CATEGORIES.get(osu_api_status)
+
+
+_RANKED_STATUS_CATEGORIES: dict[RankedStatus, Category | None] = {
+    RankedStatus.NOT_SUBMITTED: None,
+    RankedStatus.PENDING: Category.PENDING,
+    RankedStatus.UPDATE_AVAILABLE: None,
+    RankedStatus.RANKED: Category.RANKED,
+    RankedStatus.APPROVED: Category.RANKED,
+    RankedStatus.QUALIFIED: Category.QUALIFIED,
+    RankedStatus.LOVED: Category.LOVED,
+}
 
 
 class SortBy(StrEnum):
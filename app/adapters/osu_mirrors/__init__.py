@@ -1,6 +1,10 @@
+import functools
 import logging
 from datetime import datetime
 
+import httpx
+
+from app import not_found_cache
 from app.adapters.osu_mirrors.backends import AbstractBeatmapMirror
 from app.adapters.osu_mirrors.backends.mino import MinoBrazilMirror
 from app.adapters.osu_mirrors.backends.mino import MinoCentralMirror
@@ -13,18 +17,31 @@ from app.adapters.osu_mirrors.selectors.dynamic_round_robin import (
 )
 from app.repositories import beatmap_mirror_requests
 from app.repositories.beatmap_mirror_requests import MirrorResource
+from app.single_flight import SingleFlight
 
 ZIP_FILE_HEADER = b"PK\x03\x04"
 
+# Shared between all mirrors, so that they share a single connection pool,
+# rather than each mirror paying its own connection & tls setup costs
+BEATMAP_MIRRORS_HTTP_TRANSPORT = httpx.AsyncHTTPTransport(
+    http2=True,
+    limits=httpx.Limits(
+        max_connections=200,
+        max_keepalive_connections=100,
+        keepalive_expiry=60.0,
+    ),
+    retries=1,
+)
+
 BEATMAP_MIRRORS: list[AbstractBeatmapMirror] = [
-    MinoCentralMirror(),
-    MinoUSMirror(),
-    MinoBrazilMirror(),
-    MinoSingaporeMirror(),
-    NerinyanMirror(),
-    OsuDirectMirror(),
-    # GatariMirror(),  # Disabled as ratelimit is very low
-    # RippleMirror(),  # Disabled as only ranked maps are supported
+    MinoCentralMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    MinoUSMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    MinoBrazilMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    MinoSingaporeMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    NerinyanMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    OsuDirectMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),
+    # GatariMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),  # Disabled as ratelimit is very low
+    # RippleMirror(transport=BEATMAP_MIRRORS_HTTP_TRANSPORT),  # Disabled as only ranked maps are supported
 ]
 OSZ_FILE_MIRROR_SELECTOR = DynamicWeightedRoundRobinMirrorSelector(
     mirrors=[
@@ -43,17 +60,60 @@ BACKGROUND_IMAGE_MIRROR_SELECTOR = DynamicWeightedRoundRobinMirrorSelector(
     resource=MirrorResource.BACKGROUND_IMAGE,
 )
 
+_beatmap_zip_data_requests: SingleFlight[int, bytes | None] = SingleFlight()
+_background_image_requests: SingleFlight[int, bytes | None] = SingleFlight()
+
 
 def is_valid_zip_file(content: bytes) -> bool:
     return content.startswith(ZIP_FILE_HEADER)
 
 
+# Namespaced per mirror, as mirrors often lag behind each other on new or
+# updated beatmapsets. Cached so that every cache key shares one string.
+@functools.cache
+def _get_not_found_namespace(mirror_name: str, resource: MirrorResource) -> str:
+    return f"mirror:{mirror_name}:{resource}"
+
+
+def _get_mirrors_not_known_missing(
+    mirrors: list[AbstractBeatmapMirror],
+    resource: MirrorResource,
+    resource_id: int,
+) -> list[AbstractBeatmapMirror]:
+    return [
+        mirror
+        for mirror in mirrors
+        if not not_found_cache.is_not_found(
+            _get_not_found_namespace(mirror.name, resource),
+            resource_id,
+        )
+    ]
+
+
 async def fetch_beatmap_zip_data(beatmapset_id: int) -> bytes | None:
     """\
     Fetch a beatmapset .osz file by any means necessary, balancing upon
     multiple underlying beatmap mirrors to ensure the best possible
     availability and performance.
+
+    Concurrent requests for the same resource share a single download.
     """
+    return await _beatmap_zip_data_requests.run(
+        beatmapset_id,
+        lambda: _fetch_beatmap_zip_data(beatmapset_id),
+    )
+
+
+async def _fetch_beatmap_zip_data(beatmapset_id: int) -> bytes | None:
+    available_mirrors = _get_mirrors_not_known_missing(
+        OSZ_FILE_MIRROR_SELECTOR.mirrors,
+        MirrorResource.OSZ_FILE,
+        beatmapset_id,
+    )
+    if not available_mirrors:
+        # every mirror has recently told us this doesn't exist
+        return None
+
     prev_mirror: AbstractBeatmapMirror | None = None
     num_attempts = 0
 
@@ -61,14 +121,18 @@ async def fetch_beatmap_zip_data(beatmapset_id: int) -> bytes | None:
 
     while True:
         mirror = OSZ_FILE_MIRROR_SELECTOR.select_mirror()
-        if mirror is prev_mirror:
+        if mirror not in available_mirrors:
+            continue
+
+        if mirror is prev_mirror and len(available_mirrors) > 1:
             # don't allow the same mirror to be run twice, to help
             # prevent loops which cause the mirror to lose all weighting
             # because of an error on a single beatmapset
             continue
 
-        # Only retry up to 2x the number of mirrors
-        if num_attempts > OSZ_FILE_MIRROR_SELECTOR.get_num_mirrors() * 2:
+        # Only retry up to 2x the number of mirrors which may have it,
+        # so one failing mirror isn't hit (and down-weighted) repeatedly
+        if num_attempts >= len(available_mirrors) * 2:
             logging.warning(
                 "Failed to fetch beatmapset osz from any mirror",
                 extra={"beatmapset_id": beatmapset_id},
@@ -121,6 +185,12 @@ async def fetch_beatmap_zip_data(beatmapset_id: int) -> bytes | None:
         prev_mirror = mirror
         continue
 
+    if mirror_response.data is None:
+        not_found_cache.set_not_found(
+            _get_not_found_namespace(mirror.name, MirrorResource.OSZ_FILE),
+            beatmapset_id,
+        )
+
     ms_elapsed = (ended_at.timestamp() - started_at.timestamp()) * 1000
 
     logging.info(
@@ -141,7 +211,25 @@ async def fetch_beatmap_background_image(beatmap_id: int) -> bytes | None:
     Fetch a beatmap background image by any means necessary, balancing upon
     multiple underlying beatmap mirrors to ensure the best possible
     availability and performance.
+
+    Concurrent requests for the same resource share a single download.
     """
+    return await _background_image_requests.run(
+        beatmap_id,
+        lambda: _fetch_beatmap_background_image(beatmap_id),
+    )
+
+
+async def _fetch_beatmap_background_image(beatmap_id: int) -> bytes | None:
+    available_mirrors = _get_mirrors_not_known_missing(
+        BACKGROUND_IMAGE_MIRROR_SELECTOR.mirrors,
+        MirrorResource.BACKGROUND_IMAGE,
+        beatmap_id,
+    )
+    if not available_mirrors:
+        # every mirror has recently told us this doesn't exist
+        return None
+
     prev_mirror: AbstractBeatmapMirror | None = None
     num_attempts = 0
 
@@ -149,14 +237,18 @@ async def fetch_beatmap_background_image(beatmap_id: int) -> bytes | None:
 
     while True:
         mirror = BACKGROUND_IMAGE_MIRROR_SELECTOR.select_mirror()
-        if mirror is prev_mirror:
+        if mirror not in available_mirrors:
+            continue
+
+        if mirror is prev_mirror and len(available_mirrors) > 1:
             # don't allow the same mirror to be run twice, to help
             # prevent loops which cause the mirror to lose all weighting
             # because of an error on a single beatmapset
             continue
 
-        # Only retry up to 2x the number of mirrors
-        if num_attempts > BACKGROUND_IMAGE_MIRROR_SELECTOR.get_num_mirrors() * 2:
+        # Only retry up to 2x the number of mirrors which may have it,
+        # so one failing mirror isn't hit (and down-weighted) repeatedly
+        if num_attempts >= len(available_mirrors) * 2:
             logging.warning(
                 "Failed to fetch beatmap background image from any mirror",
                 extra={"beatmap_id": beatmap_id},
@@ -202,6 +294,12 @@ async def fetch_beatmap_background_image(beatmap_id: int) -> bytes | None:
         prev_mirror = mirror
         continue
 
+    if mirror_response.data is None:
+        not_found_cache.set_not_found(
+            _get_not_found_namespace(mirror.name, MirrorResource.BACKGROUND_IMAGE),
+            beatmap_id,
+        )
+
     ms_elapsed = (ended_at.timestamp() - started_at.timestamp()) * 1000
 
     logging.info(
@@ -1,3 +1,4 @@
+import io
 from abc import ABC
 from dataclasses import dataclass
 from typing import Any
@@ -11,6 +12,21 @@ from app.repositories.beatmap_mirror_requests import MirrorResource
 
 T = TypeVar("T", covariant=True)
 
+STREAMING_CHUNK_SIZE = 64 * 1024
+
+
+async def read_streamed_response_body(response: httpx.Response) -> bytes:
+    """\
+    Read a streamed response's body in fixed-size chunks.
+
+    This avoids holding both the list of received chunks and the joined
+    result in memory at once, which matters for large .osz files.
+    """
+    buffer = io.BytesIO()
+    async for chunk in response.aiter_bytes(chunk_size=STREAMING_CHUNK_SIZE):
+        buffer.write(chunk)
+    return buffer.getvalue()
+
 
 @dataclass
 class BeatmapMirrorResponse(Generic[T]):
@@ -21,13 +37,31 @@ class BeatmapMirrorResponse(Generic[T]):
     error_message: str | None = None
 
 
+def unexpected_status_code_response(
+    response: httpx.Response,
+) -> BeatmapMirrorResponse[None]:
+    """Build a failed mirror response for an unexpected status code."""
+    return BeatmapMirrorResponse(
+        data=None,
+        is_success=False,
+        request_url=str(response.request.url),
+        status_code=response.status_code,
+        error_message=f"Unexpected status code: {response.status_code}",
+    )
+
+
 class AbstractBeatmapMirror(ABC):
     name: ClassVar[str]
     base_url: ClassVar[str]
     supported_resources: ClassVar[set[MirrorResource]]
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.http_client = httpx.AsyncClient()
+    def __init__(
+        self,
+        *args: Any,
+        transport: httpx.AsyncBaseTransport | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.http_client = httpx.AsyncClient(transport=transport)
         self.weight = 0
         super().__init__(*args, **kwargs)
 
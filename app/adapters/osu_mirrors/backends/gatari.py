@@ -5,6 +5,7 @@ from typing_extensions import override
 
 from app.adapters.osu_mirrors.backends import AbstractBeatmapMirror
 from app.adapters.osu_mirrors.backends import BeatmapMirrorResponse
+from app.adapters.osu_mirrors.backends import unexpected_status_code_response
 from app.repositories.beatmap_mirror_requests import MirrorResource
 
 
@@ -31,7 +32,8 @@ class GatariMirror(AbstractBeatmapMirror):
                     request_url=str(response.request.url),
                     status_code=response.status_code,
                 )
-            response.raise_for_status()
+            if not response.is_success:
+                return unexpected_status_code_response(response)
             return BeatmapMirrorResponse(
                 data=response.read(),
                 is_success=True,
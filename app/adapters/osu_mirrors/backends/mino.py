@@ -6,6 +6,8 @@ from typing_extensions import override
 from app import settings
 from app.adapters.osu_mirrors.backends import AbstractBeatmapMirror
 from app.adapters.osu_mirrors.backends import BeatmapMirrorResponse
+from app.adapters.osu_mirrors.backends import read_streamed_response_body
+from app.adapters.osu_mirrors.backends import unexpected_status_code_response
 from app.repositories.beatmap_mirror_requests import MirrorResource
 
 
@@ -21,24 +23,26 @@ class MinoMirror(AbstractBeatmapMirror):
     ) -> BeatmapMirrorResponse[bytes | None]:
         response: httpx.Response | None = None
         try:
-            response = await self.http_client.get(
+            async with self.http_client.stream(
+                "GET",
                 f"{self.base_url}/d/{beatmapset_id}",
                 headers={"x-ratelimit-key": settings.MINO_INCREASED_RATELIMIT_KEY},
-            )
-            if response.status_code in (404, 451):
+            ) as response:
+                if response.status_code in (404, 451):
+                    return BeatmapMirrorResponse(
+                        data=None,
+                        is_success=True,
+                        request_url=str(response.request.url),
+                        status_code=response.status_code,
+                    )
+                if not response.is_success:
+                    return unexpected_status_code_response(response)
                 return BeatmapMirrorResponse(
-                    data=None,
+                    data=await read_streamed_response_body(response),
                     is_success=True,
                     request_url=str(response.request.url),
                     status_code=response.status_code,
                 )
-            response.raise_for_status()
-            return BeatmapMirrorResponse(
-                data=response.read(),
-                is_success=True,
-                request_url=str(response.request.url),
-                status_code=response.status_code,
-            )
         except Exception as exc:
             return BeatmapMirrorResponse(
                 data=None,
@@ -55,7 +59,11 @@ class MinoMirror(AbstractBeatmapMirror):
     ) -> BeatmapMirrorResponse[bytes | None]:
         response: httpx.Response | None = None
         try:
-            logging.info(f"Fetching beatmap background from mino: {beatmap_id}")
+            logging.info(
+                "Fetching beatmap background from %s: %d",
+                self.name,
+                beatmap_id,
+            )
             response = await self.http_client.get(
                 f"{self.base_url}/preview/background/{beatmap_id}",
             )
@@ -66,7 +74,8 @@ class MinoMirror(AbstractBeatmapMirror):
                     request_url=str(response.request.url),
                     status_code=response.status_code,
                 )
-            response.raise_for_status()
+            if not response.is_success:
+                return unexpected_status_code_response(response)
             return BeatmapMirrorResponse(
                 data=response.read(),
                 is_success=True,
@@ -4,7 +4,9 @@ Provides an API aligned with the Cheesegull API Specification.
 API Spec: https://docs.ripple.moe/docs/cheesegull/cheesegull-api
 """
 
+import contextlib
 import logging
+import math
 from datetime import datetime
 from enum import IntEnum
 
@@ -21,6 +23,7 @@ from app.adapters.osu_api_v2.models import Category
 from app.api.responses import JSONResponse
 from app.common_models import GameMode
 from app.common_models import RankedStatus
+from app.usecases import osu_beatmaps
 
 router = APIRouter(tags=["(Public) Cheesegull API"])
 
@@ -89,6 +92,8 @@ class CheesegullBeatmapset(BaseModel):
     def from_osu_api_beatmapset(
         cls,
         osu_api_beatmapset: BeatmapsetExtended,
+        *,
+        last_checked: datetime,
     ) -> "CheesegullBeatmapset":
         children_beatmaps: list[CheesegullBeatmap] = []
         for osu_api_beatmap in osu_api_beatmapset.beatmaps or []:
@@ -105,16 +110,18 @@ class CheesegullBeatmapset(BaseModel):
             LastUpdate=(
                 osu_api_beatmapset.ranked_date or osu_api_beatmapset.last_updated
             ),
-            LastChecked=datetime.now(),  # TODO: Implement this
+            LastChecked=last_checked,  # TODO: Implement this
             Artist=osu_api_beatmapset.artist,
             Title=osu_api_beatmapset.title,
             Creator=osu_api_beatmapset.creator,
             Source=osu_api_beatmapset.source,
             Tags=osu_api_beatmapset.tags,
             HasVideo=osu_api_beatmapset.video,
-            Genre=osu_api_beatmapset.genre.id if osu_api_beatmapset.genre else None,
+            Genre=osu_api_beatmapset.genre["id"] if osu_api_beatmapset.genre else None,
             Language=(
-                osu_api_beatmapset.language.id if osu_api_beatmapset.language else None
+                osu_api_beatmapset.language["id"]
+                if osu_api_beatmapset.language
+                else None
             ),
             Favourites=osu_api_beatmapset.favourite_count,
         )
@@ -126,7 +133,7 @@ async def cheesegull_beatmap(
     client_ip_address: str | None = Header(None, alias="X-Real-IP"),
     client_user_agent: str | None = Header(None, alias="User-Agent"),
 ) -> Response:
-    osu_api_beatmap = await api.get_beatmap(beatmap_id)
+    osu_api_beatmap = await osu_beatmaps.fetch_beatmap(beatmap_id)
     if osu_api_beatmap is None:
         return Response(status_code=404)
 
@@ -148,12 +155,13 @@ async def cheesegull_beatmapset(
     client_ip_address: str | None = Header(None, alias="X-Real-IP"),
     client_user_agent: str | None = Header(None, alias="User-Agent"),
 ) -> Response:
-    osu_api_beatmapset = await api.get_beatmapset(beatmapset_id)
+    osu_api_beatmapset = await osu_beatmaps.fetch_beatmapset(beatmapset_id)
     if osu_api_beatmapset is None:
         return Response(status_code=404)
 
     cheesegull_beatmapset = CheesegullBeatmapset.from_osu_api_beatmapset(
         osu_api_beatmapset,
+        last_checked=datetime.now(),
     )
     logging.debug(
         "Serving cheesegull beatmapset",
@@ -201,26 +209,38 @@ async def cheesegull_search(
     else:
         ranked_status = None
 
+    last_checked = datetime.now()
     num_fetched = 0
     cheesegull_beatmapsets: list[CheesegullBeatmapset] = []
     page = offset // amount + 1
-    while num_fetched < amount:
-        osu_api_search_response = await api.search_beatmapsets(
-            query=query,
-            mode=mode,
-            category=ranked_status,
-            page=page,
-        )
-        if not osu_api_search_response.beatmapsets:
-            break
-        cheesegull_beatmapsets.extend(
-            [
-                CheesegullBeatmapset.from_osu_api_beatmapset(osu_api_beatmapset)
-                for osu_api_beatmapset in osu_api_search_response.beatmapsets
-            ],
-        )
-        page += 1
-        num_fetched += len(osu_api_search_response.beatmapsets)
+    results_exhausted = False
+    while num_fetched < amount and not results_exhausted:
+        num_pages = math.ceil((amount - num_fetched) / api.SEARCH_PAGE_SIZE)
+        async with contextlib.aclosing(
+            api.iter_search_beatmapsets_pages(
+                query=query,
+                mode=mode,
+                category=ranked_status,
+                pages=range(page, page + num_pages),
+            ),
+        ) as osu_api_search_responses:
+            async for osu_api_search_response in osu_api_search_responses:
+                cheesegull_beatmapsets.extend(
+                    [
+                        CheesegullBeatmapset.from_osu_api_beatmapset(
+                            osu_api_beatmapset,
+                            last_checked=last_checked,
+                        )
+                        for osu_api_beatmapset in osu_api_search_response.beatmapsets
+                    ],
+                )
+                num_fetched += len(osu_api_search_response.beatmapsets)
+
+                # a short page means there are no more results after it
+                if len(osu_api_search_response.beatmapsets) < api.SEARCH_PAGE_SIZE:
+                    results_exhausted = True
+                    break
+        page += num_pages
 
     logging.debug(
         "Serving cheesegull search",
@@ -0,0 +1,22 @@
+import cachetools
+
+# Resources which the osu! API or a mirror has told us do not exist, shared
+# across all of them to bound memory: a full cache is ~33MB, which is sized
+# against the pod's 400Mi memory limit alongside the beatmap caches.
+NOT_FOUND_CACHE_TTL_SECONDS = 60 * 60
+NOT_FOUND_CACHE_MAX_SIZE = 100_000
+
+# Keyed by (namespace, resource id), e.g. ("beatmapset", 1) or
+# ("mirror:osu_direct:osz_file", 1)
+_not_found_resources: cachetools.TTLCache[tuple[str, int], bool] = cachetools.TTLCache(
+    maxsize=NOT_FOUND_CACHE_MAX_SIZE,
+    ttl=NOT_FOUND_CACHE_TTL_SECONDS,
+)
+
+
+def is_not_found(namespace: str, resource_id: int) -> bool:
+    return (namespace, resource_id) in _not_found_resources
+
+
+def set_not_found(namespace: str, resource_id: int) -> None:
+    _not_found_resources[(namespace, resource_id)] = True
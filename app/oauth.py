@@ -78,6 +78,10 @@ class AsyncOAuth(httpx.Auth):
             )
             response = yield request
 
+        # avoid building the log's `extra` for every response if it'd be dropped
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+
         # TODO: refactor this log to work with osu api v1, be more specific etc.
         logging.info(
             "Made oauth-authorized request",
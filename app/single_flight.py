@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Callable
+from collections.abc import Coroutine
+from collections.abc import Hashable
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """\
+    Coalesce concurrent calls for the same key into a single in-flight task.
+
+    Callers awaiting a key which is already being fetched will share the
+    result (or exception) of the original call, rather than each making
+    their own request upstream.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[K, asyncio.Task[V]] = {}
+
+    async def run(
+        self,
+        key: K,
+        coro_factory: Callable[[], Coroutine[Any, Any, V]],
+    ) -> V:
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(coro_factory())
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+            self._tasks[key] = task
+
+        # shield the shared task, so that one caller being
+        # cancelled does not cancel the request for the others
+        return await asyncio.shield(task)
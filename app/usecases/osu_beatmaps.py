@@ -0,0 +1,94 @@
+import time
+
+import cachetools
+
+from app import not_found_cache
+from app.adapters.osu_api_v2 import api
+from app.adapters.osu_api_v2.models import BeatmapExtended
+from app.adapters.osu_api_v2.models import BeatmapsetExtended
+from app.single_flight import SingleFlight
+
+# Maps in these statuses can no longer change, so are safe to cache for longer
+FROZEN_STATUSES = {"ranked", "approved", "loved"}
+
+FROZEN_CACHE_TTL_SECONDS = 60 * 60
+UNFROZEN_CACHE_TTL_SECONDS = 30
+
+# These caches count entries, not bytes, so are sized against the pod's
+# 400Mi memory limit: a validated beatmapset with ~10 difficulties is ~57KB
+# (more with converts), so ~500 sets is ~30-50MB; a beatmap is ~5KB, so
+# ~2000 beatmaps is ~10MB.
+BEATMAP_CACHE_MAX_SIZE = 2_000
+BEATMAPSET_CACHE_MAX_SIZE = 500
+
+BEATMAP_NOT_FOUND_NAMESPACE = "beatmap"
+BEATMAPSET_NOT_FOUND_NAMESPACE = "beatmapset"
+
+
+def _get_expiry_time(status: str, now: float) -> float:
+    if status in FROZEN_STATUSES:
+        return now + FROZEN_CACHE_TTL_SECONDS
+    return now + UNFROZEN_CACHE_TTL_SECONDS
+
+
+_beatmap_cache: cachetools.TLRUCache[int, BeatmapExtended] = cachetools.TLRUCache(
+    maxsize=BEATMAP_CACHE_MAX_SIZE,
+    ttu=lambda _, beatmap, now: _get_expiry_time(beatmap.status, now),
+    timer=time.monotonic,
+)
+_beatmapset_cache: cachetools.TLRUCache[int, BeatmapsetExtended] = cachetools.TLRUCache(
+    maxsize=BEATMAPSET_CACHE_MAX_SIZE,
+    ttu=lambda _, beatmapset, now: _get_expiry_time(beatmapset.status, now),
+    timer=time.monotonic,
+)
+
+_beatmap_requests: SingleFlight[int, BeatmapExtended | None] = SingleFlight()
+_beatmapset_requests: SingleFlight[int, BeatmapsetExtended | None] = SingleFlight()
+
+
+async def _fetch_and_cache_beatmap(beatmap_id: int) -> BeatmapExtended | None:
+    beatmap = await api.get_beatmap(beatmap_id)
+    if beatmap is None:
+        not_found_cache.set_not_found(BEATMAP_NOT_FOUND_NAMESPACE, beatmap_id)
+    else:
+        _beatmap_cache[beatmap_id] = beatmap
+    return beatmap
+
+
+async def _fetch_and_cache_beatmapset(
+    beatmapset_id: int,
+) -> BeatmapsetExtended | None:
+    beatmapset = await api.get_beatmapset(beatmapset_id)
+    if beatmapset is None:
+        not_found_cache.set_not_found(BEATMAPSET_NOT_FOUND_NAMESPACE, beatmapset_id)
+    else:
+        _beatmapset_cache[beatmapset_id] = beatmapset
+    return beatmapset
+
+
+async def fetch_beatmap(beatmap_id: int) -> BeatmapExtended | None:
+    if not_found_cache.is_not_found(BEATMAP_NOT_FOUND_NAMESPACE, beatmap_id):
+        return None
+
+    beatmap = _beatmap_cache.get(beatmap_id)
+    if beatmap is not None:
+        return beatmap
+
+    return await _beatmap_requests.run(
+        beatmap_id,
+        lambda: _fetch_and_cache_beatmap(beatmap_id),
+    )
+
+
+async def fetch_beatmapset(beatmapset_id: int) -> BeatmapsetExtended | None:
+    if not_found_cache.is_not_found(BEATMAPSET_NOT_FOUND_NAMESPACE, beatmapset_id):
+        return None
+
+    beatmapset = _beatmapset_cache.get(beatmapset_id)
+    if beatmapset is not None:
+        return beatmapset
+
+    return await _beatmapset_requests.run(
+        beatmapset_id,
+        lambda: _fetch_and_cache_beatmapset(beatmapset_id),
+    )